@@ -1,16 +1,35 @@
 import pygame
 import sys
-import random
+import math
 import os
+import array
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional; without it the color step falls back to plain numpy
+    HAS_NUMBA = False
 
 # Initialize pygame
+# Match the mixer to the 44.1 kHz 16-bit sound files so playback needs no resampling;
+# pre_init must come before pygame.init() to take effect
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
 pygame.init()
-pygame.mixer.init()
+# Only quit and click events are used; keep everything else off the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
 
 # ------------------- Constants -------------------
 # Screen dimensions
 WIDTH, HEIGHT = 800, 600
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
+# SCALED presents through the SDL renderer; vsync is not available on every driver
+DISPLAY_FLAGS = pygame.SCALED | pygame.DOUBLEBUF
+try:
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), DISPLAY_FLAGS, vsync=1)
+except pygame.error:
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), DISPLAY_FLAGS)
 pygame.display.set_caption("Memory Sequence Game")
 
 # Colors (Modern Dark Mode Palette)
@@ -41,11 +60,12 @@ CLOCK = pygame.time.Clock()
 BUTTON_SIZE = 150
 BUTTON_PADDING = 30
 MAX_BUTTONS = 10  # Maximum buttons allowed
+SEQUENCE_POOL_SIZE = 64  # Sequence entries generated per batch
 
 # Animation parameters
-HIGHLIGHT_ANIMATION_STEPS = 20
-HIGHLIGHT_ANIMATION_SPEED = 0.03  # Speed of color transition
-HOVER_ANIMATION_SPEED = 0.05      # Speed of hover scaling
+HIGHLIGHT_ANIMATION_STEPS = 20    # Frames per color transition
+HOVER_ANIMATION_SPEED = 0.05      # Scale change per frame while hovering
+PRESS_HOLD_TIME = 100             # Milliseconds a pressed button stays fully lit
 
 # Sound paths (ensure you have these sound files in the 'assets/sounds' directory)
 BUTTON_CLICK_SOUND_PATH = os.path.join("assets", "sounds", "button_click.wav")
@@ -55,11 +75,38 @@ GAME_OVER_SOUND_PATH = os.path.join("assets", "sounds", "game_over.wav")
 try:
     BUTTON_CLICK_SOUND = pygame.mixer.Sound(BUTTON_CLICK_SOUND_PATH)
     GAME_OVER_SOUND = pygame.mixer.Sound(GAME_OVER_SOUND_PATH)
+    # Reserve a channel for clicks so they never wait for a free one
+    pygame.mixer.set_reserved(1)
+    CLICK_CHANNEL = pygame.mixer.Channel(0)
 except:
     BUTTON_CLICK_SOUND = None
     GAME_OVER_SOUND = None
+    CLICK_CHANNEL = None
+
+# Pre-rendered shadow surfaces, shared by every button of the same size
+_SHADOW_CACHE = {}
+
+# Button rects for each button count, see create_buttons()
+_BUTTON_LAYOUT_CACHE = {}
+
+# Rendered text surfaces keyed by (font id, text, color)
+_TEXT_CACHE = {}
 
 # ------------------- Classes -------------------
+class ButtonColors:
+    # Color animation state for the game buttons, one entry per button id, so every
+    # button is advanced with a single step_colors() call per frame. A button's color
+    # is stored as how far its accent face is blended over its base face (0..1).
+    def __init__(self, count):
+        self.current = np.zeros(count, np.float32)
+        self.start = np.zeros(count, np.float32)
+        self.target = np.zeros(count, np.float32)
+        self.step = np.full(count, HIGHLIGHT_ANIMATION_STEPS, np.int32)
+        self.nsteps = np.full(count, HIGHLIGHT_ANIMATION_STEPS, np.int32)
+
+    def advance(self):
+        step_colors(self.current, self.start, self.target, self.step, self.nsteps)
+
 class Button:
     def __init__(self, rect, id):
         self.rect = rect
@@ -67,120 +114,145 @@ class Button:
         self.base_color = BUTTON_GREY
         self.highlight_color = BUTTON_HIGHLIGHT
         self.hover_color = BUTTON_HOVER
-        self.current_color = self.base_color
-        self.target_color = self.base_color
-        self.animation_step = 0
-        self.animating = False
+        # Color animation state lives in a shared ButtonColors once bound, see bind_colors()
+        self.colors = None
         self.hovered = False
         self.scale = 1.0
         self.target_scale = 1.0
         self.scale_step = 0
         self.scaling = False
+        self.accent_color = self.highlight_color  # Face blended over the base face while animating
+
+        # Pre-render the shadow and button faces once instead of every frame,
+        # converted to the display format so blits need no per-pixel conversion
+        self._shadow_surf = _get_shadow(rect.width, rect.height)
+        self._surf_base = self.render_face(self.base_color)
+        self._surf_hover = self.render_face(self.hover_color)
+        self._surf_highlight = self.render_face(self.highlight_color)
+        # Scaled faces keyed by integer scale percent
+        self._scaled_surfs = {100: (self._surf_base, self._surf_hover, self._surf_highlight)}
+        self._surf_blend = None  # Scratch surface for partially blended faces
+
+    @property
+    def animating(self):
+        return self.colors is not None and self.colors.step[self.id] < self.colors.nsteps[self.id]
+
+    def bind_colors(self, colors):
+        # Entry self.id of the shared arrays holds this button's color state; it starts idle
+        colors.current[self.id] = 0.0
+        colors.step[self.id] = colors.nsteps[self.id]
+        self.colors = colors
+
+    def render_face(self, color):
+        surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=15)
+        pygame.draw.rect(surface, BUTTON_BORDER, surface.get_rect(), 3, border_radius=15)
+        return surface.convert_alpha()
+
+    def blend_amount(self):
+        # How much of the accent face shows (0..1); unbound buttons (the menu buttons) never animate
+        if self.colors is None:
+            return 0.0
+        return float(self.colors.current[self.id])
 
     def draw(self, screen):
         # Draw shadow
-        shadow_rect = self.rect.copy()
-        shadow_rect.x += 5
-        shadow_rect.y += 5
-        shadow_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, SHADOW_COLOR, shadow_surface.get_rect(), border_radius=15)
-        screen.blit(shadow_surface, shadow_rect.topleft)
-
-        # Apply scaling for hover effect
-        scaled_width = int(self.rect.width * self.scale)
-        scaled_height = int(self.rect.height * self.scale)
-        scaled_rect = pygame.Rect(
-            self.rect.centerx - scaled_width // 2,
-            self.rect.centery - scaled_height // 2,
-            scaled_width,
-            scaled_height
-        )
+        screen.blit(*self.get_shadow())
 
         # Draw button
-        pygame.draw.rect(screen, self.current_color, scaled_rect, border_radius=15)
-        pygame.draw.rect(screen, BUTTON_BORDER, scaled_rect, 3, border_radius=15)
-
-    def is_clicked(self, pos):
-        # Adjust for scaling
-        scaled_width = int(self.rect.width * self.scale)
-        scaled_height = int(self.rect.height * self.scale)
-        scaled_rect = pygame.Rect(
-            self.rect.centerx - scaled_width // 2,
-            self.rect.centery - scaled_height // 2,
-            scaled_width,
-            scaled_height
-        )
-        return scaled_rect.collidepoint(pos)
+        screen.blit(self.get_surface(), self.get_dest())
+
+    def scaled_faces(self):
+        # Apply scaling for hover effect (only rescaled when the scale changes)
+        percent = round(self.scale * 100)
+        if percent not in self._scaled_surfs:
+            size = (int(self.rect.width * percent / 100), int(self.rect.height * percent / 100))
+            self._scaled_surfs[percent] = tuple(
+                pygame.transform.smoothscale(surface, size)
+                for surface in self._scaled_surfs[100]
+            )
+        return self._scaled_surfs[percent]
+
+    def get_shadow(self):
+        return self._shadow_surf, (self.rect.x + 5, self.rect.y + 5)
+
+    def get_surface(self):
+        # The base face, the accent face, or the accent blended over the base while animating
+        base, hover, highlight = self.scaled_faces()
+        blend = self.blend_amount()
+        if blend <= 0:
+            return base
+        accent = hover if self.accent_color == self.hover_color else highlight
+        if blend >= 1:
+            return accent
+        if self._surf_blend is None or self._surf_blend.get_size() != base.get_size():
+            self._surf_blend = base.copy()
+        else:
+            self._surf_blend.blit(base, (0, 0))
+        accent.set_alpha(int(255 * blend))
+        self._surf_blend.blit(accent, (0, 0))
+        accent.set_alpha(255)
+        return self._surf_blend
+
+    def get_dest(self):
+        # Rect of the (possibly scaled) face, centered on the button
+        return self.scaled_faces()[0].get_rect(center=self.rect.center)
 
     def start_highlight(self):
-        self.target_color = self.highlight_color
-        self.animating = True
-        self.animation_step = 0
+        self.accent_color = self.highlight_color
+        self.start_color_animation(self.highlight_color)
 
     def start_unhighlight(self):
-        self.target_color = self.base_color
-        self.animating = True
-        self.animation_step = 0
+        self.start_color_animation(self.base_color)
 
     def start_hover(self):
-        self.target_color = self.hover_color
-        self.target_scale = 1.05  # Slightly larger
-        self.scaling = True
-        self.animation_step = 0
+        self.accent_color = self.hover_color
+        self.start_color_animation(self.hover_color)
+        self.start_scale_animation(1.05)  # Slightly larger
 
     def end_hover(self):
-        self.target_color = self.base_color
-        self.target_scale = 1.0
+        self.start_color_animation(self.base_color)
+        self.start_scale_animation(1.0)
+
+    def start_color_animation(self, target_color):
+        # Interpolate linearly from the current color, finishing in exactly HIGHLIGHT_ANIMATION_STEPS
+        # frames of ButtonColors.advance(); only buttons bound to a ButtonColors can animate
+        colors = self.colors
+        colors.start[self.id] = colors.current[self.id]
+        colors.target[self.id] = 0.0 if target_color == self.base_color else 1.0
+        colors.step[self.id] = 0
+        colors.nsteps[self.id] = HIGHLIGHT_ANIMATION_STEPS
+
+    def start_scale_animation(self, target_scale):
+        self._start_scale = self.scale
+        self.target_scale = target_scale
+        self._scale_frames = max(1, round(abs(target_scale - self.scale) / HOVER_ANIMATION_SPEED))
         self.scaling = True
-        self.animation_step = 0
+        self.scale_step = 0
 
     def update(self):
-        # Handle color transitions
-        if self.animating:
-            r, g, b = self.current_color
-            tr, tg, tb = self.target_color
-
-            # Calculate the difference
-            dr = (tr - r) * HIGHLIGHT_ANIMATION_SPEED
-            dg = (tg - g) * HIGHLIGHT_ANIMATION_SPEED
-            db = (tb - b) * HIGHLIGHT_ANIMATION_SPEED
-
-            # Update current color
-            self.current_color = (
-                r + dr,
-                g + dg,
-                b + db
-            )
-
-            self.animation_step += 1
-
-            # Check if the color is close enough to target
-            if (abs(r - tr) < 1 and abs(g - tg) < 1 and abs(b - tb) < 1) or self.animation_step >= HIGHLIGHT_ANIMATION_STEPS:
-                self.current_color = self.target_color
-                self.animating = False
-
-        # Handle hover scaling
+        # Color transitions are advanced by ButtonColors.advance(); handle hover scaling
         if self.scaling:
-            if self.scale < self.target_scale:
-                self.scale += HOVER_ANIMATION_SPEED
-                if self.scale >= self.target_scale:
-                    self.scale = self.target_scale
-                    self.scaling = False
-            elif self.scale > self.target_scale:
-                self.scale -= HOVER_ANIMATION_SPEED
-                if self.scale <= self.target_scale:
-                    self.scale = self.target_scale
-                    self.scaling = False
+            self.scale_step += 1
+            t = min(1.0, self.scale_step / self._scale_frames)
+            self.scale = self._start_scale + (self.target_scale - self._start_scale) * t
+            if self.scale_step >= self._scale_frames:
+                self.scaling = False
 
 class Game:
     def __init__(self):
         self.state = "TITLE"  # Possible states: TITLE, DIFFICULTY, GAME, GAME_OVER
-        self.buttons = create_buttons(4)
-        self.sequence = []
-        self.user_sequence = []
+        self._jit_warm = not HAS_NUMBA  # See run()
+        self.colors = ButtonColors(MAX_BUTTONS)
+        self.set_buttons(4)
+        self.sequence = array.array('b')
+        self.user_sequence = array.array('b')
         self.score = 0
         self.num_buttons = 4
         self.max_buttons = MAX_BUTTONS
+        # Sequence entries are drawn in chunks and consumed one per round
+        self._rng = np.random.default_rng()
+        self.refill_pool()
         self.fonts = {
             "title": TITLE_FONT,
             "button": BUTTON_FONT,
@@ -190,13 +262,26 @@ class Game:
         self.difficulty = "Normal"  # Default difficulty
         self.display_speed = 500  # milliseconds between highlights in Normal mode
         self.fast_display_speed = 100  # minimal delay in Fast mode
+        # Restored under animating buttons; their dirty rects never reach a neighbouring button
+        self._bg_cache = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._bg_cache.fill(DARK_BACKGROUND)
+        self._score_text = (None, None)  # (score, rendered surface)
+        self._blit_list = []
+        # Menu buttons never change, so they are built once and reused every frame
+        self._menu_buttons = {
+            "start": Button(pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60), -1),     # ID -1 for Start Button
+            "normal": Button(pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 50, 200, 60), 0),     # ID 0 for Normal
+            "fast": Button(pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60), 1),       # ID 1 for Fast
+            "restart": Button(pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 100, 200, 60), -2),  # ID -2 for Restart Button
+        }
 
     def reset_game(self):
-        self.sequence = []
-        self.user_sequence = []
+        self.sequence = array.array('b')
+        self.user_sequence = array.array('b')
         self.score = 0
         self.num_buttons = 4
-        self.buttons = create_buttons(self.num_buttons)
+        self.set_buttons(self.num_buttons)
+        self.refill_pool()
 
     def add_buttons(self, count=2):
         """
@@ -205,27 +290,45 @@ class Game:
         for _ in range(count):
             if self.num_buttons < self.max_buttons:
                 self.num_buttons += 1
-        self.buttons = create_buttons(self.num_buttons)
+        self.set_buttons(self.num_buttons)
+
+    def set_buttons(self, num_buttons):
+        self.buttons = create_buttons(num_buttons)
+        self._pending_unhighlights = {}  # Pressed button -> time it starts fading back
+        for button in self.buttons:
+            button.bind_colors(self.colors)
+        self.refresh_hit_rects()
+
+    def refresh_hit_rects(self):
+        # Click targets for Rect.collidelist, rebuilt whenever the buttons change
+        self._hit_rects = [button.get_dest() for button in self.buttons]
+
+    def refill_pool(self):
+        self._pool = self._rng.integers(0, self.num_buttons, size=SEQUENCE_POOL_SIZE, dtype=np.int8)
+        self._pool_i = 0
+        self._pool_buttons = self.num_buttons
 
     def add_to_sequence(self):
-        self.sequence.append(random.randint(0, self.num_buttons -1))
+        # Refill when the chunk is used up or new buttons widened the range
+        if self._pool_i == len(self._pool) or self._pool_buttons != self.num_buttons:
+            self.refill_pool()
+        self.sequence.append(int(self._pool[self._pool_i]))
+        self._pool_i += 1
 
     def draw_title_screen(self):
         SCREEN.fill(DARK_BACKGROUND)
         # Title
-        title_text = self.fonts["title"].render("Memory Sequence", True, TEXT_COLOR)
+        title_text = render_cached(self.fonts["title"], "Memory Sequence", TEXT_COLOR)
         title_rect = title_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 100))
         SCREEN.blit(title_text, title_rect)
 
         # Start Button
-        start_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60)
-        start_button = Button(start_button_rect, -1)  # ID -1 for Start Button
-        start_button.current_color = BUTTON_GREY
+        start_button = self._menu_buttons["start"]
         start_button.draw(SCREEN)
 
         # Start Text
-        start_text = self.fonts["button"].render("Start", True, TEXT_COLOR)
-        start_text_rect = start_text.get_rect(center=start_button_rect.center)
+        start_text = render_cached(self.fonts["button"], "Start", TEXT_COLOR)
+        start_text_rect = start_text.get_rect(center=start_button.rect.center)
         SCREEN.blit(start_text, start_text_rect)
 
         pygame.display.flip()
@@ -233,24 +336,22 @@ class Game:
     def draw_difficulty_screen(self):
         SCREEN.fill(DARK_BACKGROUND)
         # Difficulty Title
-        difficulty_title = self.fonts["title"].render("Select Difficulty", True, TEXT_COLOR)
+        difficulty_title = render_cached(self.fonts["title"], "Select Difficulty", TEXT_COLOR)
         difficulty_title_rect = difficulty_title.get_rect(center=(WIDTH//2, HEIGHT//2 - 150))
         SCREEN.blit(difficulty_title, difficulty_title_rect)
 
         # Normal Button
-        normal_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 50, 200, 60)
-        normal_button = Button(normal_button_rect, 0)  # ID 0 for Normal
+        normal_button = self._menu_buttons["normal"]
         normal_button.draw(SCREEN)
-        normal_text = self.fonts["button"].render("Normal", True, TEXT_COLOR)
-        normal_text_rect = normal_text.get_rect(center=normal_button_rect.center)
+        normal_text = render_cached(self.fonts["button"], "Normal", TEXT_COLOR)
+        normal_text_rect = normal_text.get_rect(center=normal_button.rect.center)
         SCREEN.blit(normal_text, normal_text_rect)
 
         # Fast Button
-        fast_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60)
-        fast_button = Button(fast_button_rect, 1)  # ID 1 for Fast
+        fast_button = self._menu_buttons["fast"]
         fast_button.draw(SCREEN)
-        fast_text = self.fonts["button"].render("Fast", True, TEXT_COLOR)
-        fast_text_rect = fast_text.get_rect(center=fast_button_rect.center)
+        fast_text = render_cached(self.fonts["button"], "Fast", TEXT_COLOR)
+        fast_text_rect = fast_text.get_rect(center=fast_button.rect.center)
         SCREEN.blit(fast_text, fast_text_rect)
 
         pygame.display.flip()
@@ -258,56 +359,91 @@ class Game:
     def draw_game_over_screen(self):
         SCREEN.fill(DARK_BACKGROUND)
         # Game Over Text
-        game_over_text = self.fonts["title"].render("Game Over", True, TEXT_COLOR)
+        game_over_text = render_cached(self.fonts["title"], "Game Over", TEXT_COLOR)
         game_over_rect = game_over_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 100))
         SCREEN.blit(game_over_text, game_over_rect)
 
         # Score Text
-        score_text = self.fonts["score"].render(f"Score: {self.score}", True, TEXT_COLOR)
+        # The score only changes between games, so re-render it only when it differs
+        if self._score_text[0] != self.score:
+            self._score_text = (self.score, self.fonts["score"].render(f"Score: {self.score}", True, TEXT_COLOR).convert_alpha())
+        score_text = self._score_text[1]
         score_rect = score_text.get_rect(center=(WIDTH//2, HEIGHT//2))
         SCREEN.blit(score_text, score_rect)
 
         # Restart Button
-        restart_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 100, 200, 60)
-        restart_button = Button(restart_button_rect, -2)  # ID -2 for Restart Button
+        restart_button = self._menu_buttons["restart"]
         restart_button.draw(SCREEN)
 
         # Restart Text
-        restart_text = self.fonts["button"].render("Restart", True, TEXT_COLOR)
-        restart_text_rect = restart_text.get_rect(center=restart_button_rect.center)
+        restart_text = render_cached(self.fonts["button"], "Restart", TEXT_COLOR)
+        restart_text_rect = restart_text.get_rect(center=restart_button.rect.center)
         SCREEN.blit(restart_text, restart_text_rect)
 
         pygame.display.flip()
 
     def draw_buttons(self):
+        # Collect every shadow and face and hand them to SDL in a single blits() call
+        self._blit_list.clear()
         for button in self.buttons:
-            button.draw(SCREEN)
+            self._blit_list.append(button.get_shadow())
+            self._blit_list.append((button.get_surface(), button.get_dest()))
+        SCREEN.blits(self._blit_list, doreturn=False)
+
+    def wait(self, ms):
+        # Keep pumping the event queue while waiting so the window stays responsive.
+        # Only QUIT is consumed; clicks stay queued for the input phase.
+        deadline = pygame.time.get_ticks() + ms
+        while pygame.time.get_ticks() < deadline:
+            for event in pygame.event.get(pygame.QUIT):
+                pygame.quit()
+                sys.exit()
+            self.tick_animation()
+
+    def settle_animations(self):
+        # Like wait(), but until every pressed button has faded back and no animation is running
+        while self._pending_unhighlights or any(btn.animating or btn.scaling for btn in self.buttons):
+            for event in pygame.event.get(pygame.QUIT):
+                pygame.quit()
+                sys.exit()
+            self.tick_animation()
+
+    def tick_animation(self):
+        # Advance running button animations by one frame, starting any unhighlights that are due
+        now = pygame.time.get_ticks()
+        for button, due in list(self._pending_unhighlights.items()):
+            if now >= due and not button.animating:
+                button.start_unhighlight()
+                del self._pending_unhighlights[button]
+        self._run_animation(1)
+
+    def _run_animation(self, nframes=HIGHLIGHT_ANIMATION_STEPS):
+        # Every animation frame is drawn here. Idle buttons are already on screen, so only
+        # the active ones are restored from the background, advanced, redrawn and presented.
+        active = [btn for btn in self.buttons if btn.animating or btn.scaling]
+        dirty = [btn.rect.inflate(20, 20) for btn in active]
+        for _ in range(nframes):
+            for rect in dirty:
+                SCREEN.blit(self._bg_cache, rect, rect)
+            self.colors.advance()
+            for btn in active:
+                btn.update()
+                btn.draw(SCREEN)
+            if dirty:
+                update_display(dirty)
+            CLOCK.tick(FPS)
 
     def animate_sequence(self):
         for button_id in self.sequence:
             button = self.buttons[button_id]
             button.start_highlight()
             if BUTTON_CLICK_SOUND:
-                BUTTON_CLICK_SOUND.play()
-            for _ in range(HIGHLIGHT_ANIMATION_STEPS):
-                SCREEN.fill(DARK_BACKGROUND)
-                self.draw_buttons()
-                for btn in self.buttons:
-                    btn.update()
-                    btn.draw(SCREEN)
-                pygame.display.flip()
-                CLOCK.tick(FPS)
-            pygame.time.delay(self.fast_display_speed if self.difficulty == "Fast" else self.display_speed)
+                CLICK_CHANNEL.play(BUTTON_CLICK_SOUND)
+            self._run_animation()
+            self.wait(self.fast_display_speed if self.difficulty == "Fast" else self.display_speed)
             button.start_unhighlight()
-            for _ in range(HIGHLIGHT_ANIMATION_STEPS):
-                SCREEN.fill(DARK_BACKGROUND)
-                self.draw_buttons()
-                for btn in self.buttons:
-                    btn.update()
-                    btn.draw(SCREEN)
-                pygame.display.flip()
-                CLOCK.tick(FPS)
-            pygame.time.delay(100)
+            self._run_animation()
+            self.wait(100)
 
     def run_gameplay(self):
         self.reset_game()
@@ -317,58 +453,45 @@ class Game:
             self.draw_buttons()
             pygame.display.flip()
 
-            pygame.time.delay(500)
+            self.wait(500)
 
             # Add to sequence and animate
             self.add_to_sequence()
             self.animate_sequence()
 
             # User input phase
-            self.user_sequence = []
-            for idx in range(len(self.sequence)):
-                user_input = None
-                while user_input is None:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            pygame.quit()
-                            sys.exit()
-                        if event.type == pygame.MOUSEBUTTONDOWN:
-                            pos = pygame.mouse.get_pos()
-                            for button in self.buttons:
-                                if button.is_clicked(pos):
-                                    user_input = button.id
-                                    button.start_highlight()
-                                    if BUTTON_CLICK_SOUND:
-                                        BUTTON_CLICK_SOUND.play()
-                                    # Animate button press
-                                    for _ in range(HIGHLIGHT_ANIMATION_STEPS):
-                                        SCREEN.fill(DARK_BACKGROUND)
-                                        self.draw_buttons()
-                                        for btn in self.buttons:
-                                            btn.update()
-                                            btn.draw(SCREEN)
-                                        pygame.display.flip()
-                                        CLOCK.tick(FPS)
-                                    pygame.time.delay(100)
-                                    button.start_unhighlight()
-                                    for _ in range(HIGHLIGHT_ANIMATION_STEPS):
-                                        SCREEN.fill(DARK_BACKGROUND)
-                                        self.draw_buttons()
-                                        for btn in self.buttons:
-                                            btn.update()
-                                            btn.draw(SCREEN)
-                                        pygame.display.flip()
-                                        CLOCK.tick(FPS)
-                                    self.user_sequence.append(user_input)
-                                    # Check correctness
-                                    if user_input != self.sequence[idx]:
-                                        if GAME_OVER_SOUND:
-                                            GAME_OVER_SOUND.play()
-                                        running = False
-                                    break
-                    CLOCK.tick(FPS)
-                if not running:
-                    break
+            self.user_sequence = array.array('b')
+            idx = 0
+            while running and idx < len(self.sequence):
+                # Handle every click in the batch so quick successive presses are not lost
+                for event in pygame.event.get((pygame.QUIT, pygame.MOUSEBUTTONDOWN)):
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        if any(button.scale != 1.0 for button in self.buttons):
+                            self.refresh_hit_rects()  # Hovered buttons are scaled
+                        hit = pygame.Rect(event.pos, (1, 1)).collidelist(self._hit_rects)
+                        if hit >= 0:
+                            button = self.buttons[hit]
+                            user_input = button.id
+                            button.start_highlight()
+                            if BUTTON_CLICK_SOUND:
+                                CLICK_CHANNEL.play(BUTTON_CLICK_SOUND)
+                            # Fade back from tick_animation() once fully lit, so the next click is accepted right away
+                            self._pending_unhighlights[button] = (pygame.time.get_ticks() + PRESS_HOLD_TIME
+                                                                  + HIGHLIGHT_ANIMATION_STEPS * 1000 // FPS)
+                            self.user_sequence.append(user_input)
+                            # Check correctness
+                            if user_input != self.sequence[idx]:
+                                if GAME_OVER_SOUND:
+                                    GAME_OVER_SOUND.play()
+                                running = False
+                                break
+                            idx += 1
+                            if idx == len(self.sequence):
+                                break
+                self.tick_animation()
 
             if not running:
                 break
@@ -378,8 +501,10 @@ class Game:
 
             # Dynamically add more buttons in pairs
             if self.score % 5 ==0 and self.num_buttons < self.max_buttons:
+                # Let the last press fade out first; the rebuilt grid drops pending unhighlights
+                self.settle_animations()
                 self.add_buttons(count=2)
-                pygame.time.delay(300)
+                self.wait(300)
 
         # After game loop ends, transition to Game Over
         self.state = "GAME_OVER"
@@ -388,45 +513,45 @@ class Game:
         while True:
             if self.state == "TITLE":
                 self.draw_title_screen()
-                for event in pygame.event.get():
+                if not self._jit_warm:
+                    # Compile (or load the cached) JIT kernel while the title screen is up,
+                    # rather than before the first paint or on the first highlight
+                    ButtonColors(1).advance()
+                    self._jit_warm = True
+                for event in pygame.event.get((pygame.QUIT, pygame.MOUSEBUTTONDOWN)):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         pos = pygame.mouse.get_pos()
                         # Check if Start button is clicked
-                        start_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60)
-                        if start_button_rect.collidepoint(pos):
+                        if self._menu_buttons["start"].rect.collidepoint(pos):
                             self.state = "DIFFICULTY"
                             break
-                pygame.display.flip()
                 CLOCK.tick(FPS)
 
             elif self.state == "DIFFICULTY":
                 self.draw_difficulty_screen()
-                for event in pygame.event.get():
+                for event in pygame.event.get((pygame.QUIT, pygame.MOUSEBUTTONDOWN)):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         pos = pygame.mouse.get_pos()
                         # Check if Normal button is clicked
-                        normal_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 50, 200, 60)
-                        if normal_button_rect.collidepoint(pos):
+                        if self._menu_buttons["normal"].rect.collidepoint(pos):
                             self.difficulty = "Normal"
                             self.display_speed = 500  # milliseconds
                             self.fast_display_speed = 100  # minimal delay
                             self.state = "GAME"
                             break
                         # Check if Fast button is clicked
-                        fast_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 50, 200, 60)
-                        if fast_button_rect.collidepoint(pos):
+                        if self._menu_buttons["fast"].rect.collidepoint(pos):
                             self.difficulty = "Fast"
                             self.display_speed = 100  # faster display
                             self.fast_display_speed = 50  # minimal delay
                             self.state = "GAME"
                             break
-                pygame.display.flip()
                 CLOCK.tick(FPS)
 
             elif self.state == "GAME":
@@ -435,29 +560,59 @@ class Game:
 
             elif self.state == "GAME_OVER":
                 self.draw_game_over_screen()
-                for event in pygame.event.get():
+                for event in pygame.event.get((pygame.QUIT, pygame.MOUSEBUTTONDOWN)):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         pos = pygame.mouse.get_pos()
                         # Check if Restart button is clicked
-                        restart_button_rect = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 + 100, 200, 60)
-                        if restart_button_rect.collidepoint(pos):
+                        if self._menu_buttons["restart"].rect.collidepoint(pos):
                             self.state = "TITLE"
                             break
-                pygame.display.flip()
                 CLOCK.tick(FPS)
 
 # ------------------- Helper Functions -------------------
+def _get_shadow(w, h):
+    # Game buttons and menu buttons each share a single shadow surface
+    shadow_surface = _SHADOW_CACHE.get((w, h))
+    if shadow_surface is None:
+        shadow_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surface, SHADOW_COLOR, shadow_surface.get_rect(), border_radius=15)
+        shadow_surface = shadow_surface.convert_alpha()
+        _SHADOW_CACHE[(w, h)] = shadow_surface
+    return shadow_surface
+
+def _step_colors_np(current, start, target, step, nsteps):
+    # Advance every animating button by one frame of its linear blend interpolation
+    running = step < nsteps
+    step[running] += 1
+    t = step[running] / nsteps[running]
+    current[running] = start[running] + (target[running] - start[running]) * t
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _step_colors_jit(current, start, target, step, nsteps):
+        # Same as _step_colors_np, compiled to a single loop
+        for i in range(current.shape[0]):
+            if step[i] < nsteps[i]:
+                step[i] += 1
+                t = step[i] / nsteps[i]
+                current[i] = start[i] + (target[i] - start[i]) * t
+
+step_colors = _step_colors_jit if HAS_NUMBA else _step_colors_np
+
 def create_buttons(num_buttons):
-    buttons = []
+    # The grid only depends on the button count, so compute each layout once
+    if num_buttons not in _BUTTON_LAYOUT_CACHE:
+        _BUTTON_LAYOUT_CACHE[num_buttons] = button_layout(num_buttons)
+    return [Button(rect.copy(), i) for i, rect in enumerate(_BUTTON_LAYOUT_CACHE[num_buttons])]
+
+def button_layout(num_buttons):
+    rects = []
     # Determine grid size (square as much as possible)
-    grid_cols = grid_rows = int(num_buttons ** 0.5)
-    if grid_cols ** 2 < num_buttons:
-        grid_cols += 1
-    if grid_cols * grid_rows < num_buttons:
-        grid_rows +=1
+    grid_cols = math.isqrt(num_buttons - 1) + 1
+    grid_rows = -(-num_buttons // grid_cols)  # Ceiling division
 
     # Calculate total grid size
     total_width = grid_cols * BUTTON_SIZE + (grid_cols - 1) * BUTTON_PADDING
@@ -472,9 +627,26 @@ def create_buttons(num_buttons):
         col = i % grid_cols
         x = start_x + col * (BUTTON_SIZE + BUTTON_PADDING)
         y = start_y + row * (BUTTON_SIZE + BUTTON_PADDING)
-        rect = pygame.Rect(x, y, BUTTON_SIZE, BUTTON_SIZE)
-        buttons.append(Button(rect, i))
-    return buttons
+        rects.append(pygame.Rect(x, y, BUTTON_SIZE, BUTTON_SIZE))
+    return rects
+
+def render_cached(font, text, color):
+    # Static labels are rendered once and reused every frame
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+    return surface
+
+def update_display(dirty_rects):
+    # A SCALED display presents the whole frame through the renderer even for
+    # display.update(rects), so partial updates only pay off without SCALED and
+    # while the dirty area is small
+    if DISPLAY_FLAGS & pygame.SCALED or sum(rect.width * rect.height for rect in dirty_rects) > WIDTH * HEIGHT // 2:
+        pygame.display.flip()
+    else:
+        pygame.display.update(dirty_rects)
 
 # ------------------- Main Execution -------------------
 if __name__ == "__main__":